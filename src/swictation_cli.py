@@ -6,8 +6,8 @@ Swictation CLI - Send commands to the daemon via Unix socket.
 import sys
 import socket
 import json
-import argparse
 import os
+from typing import Optional
 
 
 def get_socket_path() -> str:
@@ -43,6 +43,58 @@ def get_socket_path() -> str:
 # Get platform-appropriate socket path
 SOCKET_PATH = get_socket_path()
 
+# Read size for daemon responses (larger replies span several reads)
+RECV_BUFSIZE = 4096
+
+
+def recv_response(sock: socket.socket) -> Optional[dict]:
+    """Read and parse one daemon response from the socket.
+
+    Responses are not framed, so the reply is scanned as it arrives and
+    parsed once its top-level JSON object closes, rather than assuming it
+    fits in a single recv().
+
+    Returns:
+        Parsed response, or None if the daemon closed the connection before
+        sending a complete reply
+
+    Raises:
+        ValueError: If the reply is not a JSON object or does not parse
+    """
+    data = bytearray()
+    depth = 0
+    in_string = escaped = False
+    while True:
+        chunk = sock.recv(RECV_BUFSIZE)
+        if not chunk:
+            return None
+
+        start = len(data)
+        data += chunk
+        for i in range(start, len(data)):
+            byte = data[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif byte == 0x5C:  # backslash
+                    escaped = True
+                elif byte == 0x22:  # closing quote
+                    in_string = False
+            elif depth == 0:
+                # Only whitespace may precede the top-level object
+                if byte == 0x7B:  # {
+                    depth = 1
+                elif byte not in b' \t\r\n':
+                    raise ValueError(f"unexpected daemon response: {bytes(data[:64])!r}")
+            elif byte == 0x22:
+                in_string = True
+            elif byte in b'{[':
+                depth += 1
+            elif byte in b'}]':
+                depth -= 1
+                if depth == 0:
+                    return json.loads(bytes(data[:i + 1]).decode('utf-8'))
+
 
 def send_command(command: dict, socket_path: str = SOCKET_PATH) -> dict:
     """
@@ -65,8 +117,9 @@ def send_command(command: dict, socket_path: str = SOCKET_PATH) -> dict:
         client.sendall(json.dumps(command).encode('utf-8'))
 
         # Receive response
-        response_data = client.recv(1024)
-        response = json.loads(response_data.decode('utf-8'))
+        response = recv_response(client)
+        if response is None:
+            return {'error': 'Daemon closed the connection without a response'}
 
         client.close()
         return response
@@ -173,8 +226,19 @@ def cmd_summary(args):
         cli.close()
 
 
-def main():
-    """CLI entry point"""
+# Commands without arguments, dispatched directly without building the parser
+SIMPLE_COMMANDS = {
+    'toggle': cmd_toggle,
+    'status': cmd_status,
+    'stop': cmd_stop,
+    'summary': cmd_summary,
+}
+
+
+def build_parser():
+    """Build the full argument parser (only needed for commands with arguments)"""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Swictation voice dictation control'
     )
@@ -186,21 +250,21 @@ def main():
         'toggle',
         help='Toggle recording on/off'
     )
-    toggle_parser.set_defaults(func=cmd_toggle)
+    toggle_parser.set_defaults(func=SIMPLE_COMMANDS['toggle'])
 
     # Status command
     status_parser = subparsers.add_parser(
         'status',
         help='Get daemon status'
     )
-    status_parser.set_defaults(func=cmd_status)
+    status_parser.set_defaults(func=SIMPLE_COMMANDS['status'])
 
     # Stop command
     stop_parser = subparsers.add_parser(
         'stop',
         help='Stop daemon'
     )
-    stop_parser.set_defaults(func=cmd_stop)
+    stop_parser.set_defaults(func=SIMPLE_COMMANDS['stop'])
 
     # Stats command
     stats_parser = subparsers.add_parser(
@@ -233,10 +297,21 @@ def main():
         'summary',
         help='Show lifetime statistics'
     )
-    summary_parser.set_defaults(func=cmd_summary)
+    summary_parser.set_defaults(func=SIMPLE_COMMANDS['summary'])
+
+    return parser
+
+
+def main():
+    """CLI entry point"""
+    argv = sys.argv[1:]
+
+    # Fast path for bare commands (e.g. 'toggle' bound to a hotkey)
+    if len(argv) == 1 and argv[0] in SIMPLE_COMMANDS:
+        return SIMPLE_COMMANDS[argv[0]](None)
 
-    # Parse args
-    args = parser.parse_args()
+    parser = build_parser()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
@@ -7,6 +7,7 @@ import socket
 import json
 import subprocess
 from pathlib import Path
+from typing import Optional
 from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QMenu
 from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QCursor
 from PySide6.QtCore import QObject, Signal, QTimer, QEvent, Qt, Slot
@@ -33,6 +34,62 @@ def get_socket_path() -> str:
     return '/tmp/swictation.sock'
 
 
+# Read size for daemon responses (larger replies span several reads)
+RECV_BUFSIZE = 4096
+
+
+def recv_response(sock: socket.socket) -> Optional[dict]:
+    """Read and parse one daemon response from the socket.
+
+    Mirrors swictation_cli.recv_response(); the tray ships standalone in the
+    npm package, so it cannot import the CLI module.
+
+    Responses are not framed, so the reply is scanned as it arrives and
+    parsed once its top-level JSON object closes, rather than assuming it
+    fits in a single recv().
+
+    Returns:
+        Parsed response, or None if the daemon closed the connection before
+        sending a complete reply
+
+    Raises:
+        ValueError: If the reply is not a JSON object or does not parse
+    """
+    data = bytearray()
+    depth = 0
+    in_string = escaped = False
+    while True:
+        chunk = sock.recv(RECV_BUFSIZE)
+        if not chunk:
+            return None
+
+        start = len(data)
+        data += chunk
+        for i in range(start, len(data)):
+            byte = data[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif byte == 0x5C:  # backslash
+                    escaped = True
+                elif byte == 0x22:  # closing quote
+                    in_string = False
+            elif depth == 0:
+                # Only whitespace may precede the top-level object
+                if byte == 0x7B:  # {
+                    depth = 1
+                elif byte not in b' \t\r\n':
+                    raise ValueError(f"unexpected daemon response: {bytes(data[:64])!r}")
+            elif byte == 0x22:
+                in_string = True
+            elif byte in b'{[':
+                depth += 1
+            elif byte in b'}]':
+                depth -= 1
+                if depth == 0:
+                    return json.loads(bytes(data[:i + 1]).decode('utf-8'))
+
+
 class TrayEventFilter(QObject):
     """Event filter to intercept tray icon right-clicks before Qt's buggy Wayland handler.
 
@@ -163,19 +220,20 @@ class SwictationTrayApp(QApplication):
             sock.settimeout(2.0)
             sock.connect(self.socket_path)
             sock.sendall(json.dumps({'action': 'toggle'}).encode('utf-8'))
-            response = sock.recv(1024)
+            try:
+                resp_data = recv_response(sock)
+            except ValueError as e:
+                resp_data = None
+                print(f"✗ Unexpected toggle response: {e}")
             sock.close()
 
-            # Parse response to update state immediately
-            try:
-                resp_data = json.loads(response.decode('utf-8'))
+            # Use response to update state immediately
+            if resp_data is not None:
                 if resp_data.get('success'):
                     new_state = resp_data.get('state', self.current_state)
                     self.update_state(new_state)
-            except:
-                pass
 
-            print(f"✓ Toggle response: {response.decode('utf-8')}")
+                print(f"✓ Toggle response: {json.dumps(resp_data)}")
         except Exception as e:
             print(f"✗ Toggle failed: {e}")
             self.tray_icon.showMessage(
@@ -202,16 +260,16 @@ class SwictationTrayApp(QApplication):
             sock.settimeout(0.5)  # Short timeout for status check
             sock.connect(self.socket_path)
             sock.sendall(json.dumps({'action': 'status'}).encode('utf-8'))
-            response = sock.recv(1024)
+            try:
+                resp_data = recv_response(sock)
+            except ValueError:
+                resp_data = None
             sock.close()
 
-            # Parse response and update state
-            try:
-                resp_data = json.loads(response.decode('utf-8'))
+            # Update state from response
+            if resp_data is not None:
                 new_state = resp_data.get('state', 'idle')
                 self.update_state(new_state)
-            except:
-                pass
         except:
             # Socket connection failed, assume idle
             self.update_state('idle')